@@ -65,8 +65,12 @@ class _LazyModule(ModuleType):
 
     def _import(self) -> ModuleType:
         # import the referenced module, replacing the proxy in this module's globals
+        # (the proxy may be bound under an alias, eg: "urllib.request" is bound to
+        # `urllib_request`, so we look for it by identity rather than by name)
         module = import_module(self.__name__)
-        self._globals[self._module_name] = module
+        for name, obj in list(self._globals.items()):
+            if obj is self:
+                self._globals[name] = module
         self.__dict__.update(module.__dict__)
         return module
 
@@ -148,6 +152,7 @@ if TYPE_CHECKING:
     import json
     import pickle
     import subprocess
+    import urllib.request as urllib_request
 
     import deltalake
     import fsspec
@@ -171,6 +176,7 @@ else:
     json, _ = _lazy_import("json")
     pickle, _ = _lazy_import("pickle")
     subprocess, _ = _lazy_import("subprocess")
+    urllib_request, _ = _lazy_import("urllib.request")
 
     # heavy/optional third party libs
     deltalake, _DELTALAKE_AVAILABLE = _lazy_import("deltalake")
@@ -297,6 +303,7 @@ __all__ = [
     "json",
     "pickle",
     "subprocess",
+    "urllib_request",
     # lazy-load third party libs
     "deltalake",
     "fsspec",
@@ -16,6 +16,7 @@ class ExprArrayNameSpace:
     """Namespace for array related expressions."""
 
     _accessor = "arr"
+    __slots__ = ("_pyexpr",)
 
     def __init__(self, expr: Expr):
         self._pyexpr = expr._pyexpr
@@ -14,6 +14,7 @@ class ExprBinaryNameSpace:
     """Namespace for bin related expressions."""
 
     _accessor = "bin"
+    __slots__ = ("_pyexpr",)
 
     def __init__(self, expr: Expr):
         self._pyexpr = expr._pyexpr
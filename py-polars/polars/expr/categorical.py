@@ -14,6 +14,7 @@ class ExprCatNameSpace:
     """Namespace for categorical related expressions."""
 
     _accessor = "cat"
+    __slots__ = ("_pyexpr",)
 
     def __init__(self, expr: Expr):
         self._pyexpr = expr._pyexpr
@@ -36,6 +36,7 @@ class ExprDateTimeNameSpace:
     """Namespace for datetime related expressions."""
 
     _accessor = "dt"
+    __slots__ = ("_pyexpr",)
 
     def __init__(self, expr: Expr):
         self._pyexpr = expr._pyexpr
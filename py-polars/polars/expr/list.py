@@ -28,6 +28,7 @@ class ExprListNameSpace:
     """Namespace for list related expressions."""
 
     _accessor = "list"
+    __slots__ = ("_pyexpr",)
 
     def __init__(self, expr: Expr):
         self._pyexpr = expr._pyexpr
@@ -22,6 +22,7 @@ class ExprMetaNameSpace:
     """Namespace for expressions on a meta level."""
 
     _accessor = "meta"
+    __slots__ = ("_pyexpr",)
 
     def __init__(self, expr: Expr):
         self._pyexpr = expr._pyexpr
@@ -10,6 +10,7 @@ class ExprNameNameSpace:
     """Namespace for expressions that operate on expression names."""
 
     _accessor = "name"
+    __slots__ = ("_from_pyexpr", "_pyexpr")
 
     def __init__(self, expr: Expr):
         self._from_pyexpr = expr._from_pyexpr
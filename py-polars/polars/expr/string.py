@@ -35,6 +35,7 @@ class ExprStringNameSpace:
     """Namespace for string related expressions."""
 
     _accessor = "str"
+    __slots__ = ("_pyexpr",)
 
     def __init__(self, expr: Expr):
         self._pyexpr = expr._pyexpr
@@ -15,6 +15,7 @@ class ExprStructNameSpace:
     """Namespace for struct related expressions."""
 
     _accessor = "struct"
+    __slots__ = ("_pyexpr",)
 
     def __init__(self, expr: Expr):
         self._pyexpr = expr._pyexpr
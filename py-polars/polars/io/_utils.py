@@ -1,16 +1,23 @@
 from __future__ import annotations
 
+import codecs
 import glob
+import os
 import re
-from contextlib import contextmanager
-from io import BytesIO, StringIO
+from contextlib import nullcontext
+from io import BytesIO, StringIO, TextIOBase
 from pathlib import Path
-from typing import IO, Any, ContextManager, Iterator, Sequence, overload
+from typing import IO, Any, ContextManager, Iterator, Sequence, cast, overload
 
 from polars._utils.various import is_int_sequence, is_str_sequence, normalize_filepath
-from polars.dependencies import _FSSPEC_AVAILABLE, fsspec
+from polars.dependencies import _FSSPEC_AVAILABLE, fsspec, urllib_request
 from polars.exceptions import NoDataError
 
+_CHUNK_SIZE = 1 << 20
+_UTF8_ENCODINGS = frozenset(("utf8", "utf8-lossy"))
+_GLOB_CHARS = frozenset("*?[")
+_CLOUD_RE = re.compile(r"^(s3a?|gs|gcs|file|abfss?|azure|az|adl|https?)://")
+
 
 def parse_columns_arg(
     columns: Sequence[str] | Sequence[int] | str | int | None,
@@ -137,17 +144,7 @@ def prepare_file_arg(
         msg = "`fsspec` is required for `storage_options` argument"
         raise ImportError(msg)
 
-    # Small helper to use a variable as context
-    @contextmanager
-    def managed_file(file: Any) -> Iterator[Any]:
-        try:
-            yield file
-        finally:
-            pass
-
-    has_utf8_utf8_lossy_encoding = (
-        encoding in {"utf8", "utf8-lossy"} if encoding else True
-    )
+    has_utf8_utf8_lossy_encoding = encoding in _UTF8_ENCODINGS if encoding else True
     encoding_str = encoding if encoding else "utf8"
 
     # PyArrow allows directories, so we only check that something is not
@@ -156,28 +153,37 @@ def prepare_file_arg(
 
     if isinstance(file, bytes):
         if not has_utf8_utf8_lossy_encoding:
-            file = file.decode(encoding_str).encode("utf8")
+            return _check_empty(
+                _transcode_to_utf8_bytesio(file, encoding_str),
+                context="bytes",
+                raise_if_empty=raise_if_empty,
+            )
         return _check_empty(
-            BytesIO(file), context="bytes", raise_if_empty=raise_if_empty
+            BytesIO(file),
+            context="bytes",
+            raise_if_empty=raise_if_empty,
+            size=len(file),
         )
 
     if isinstance(file, StringIO):
+        data = file.read().encode("utf8")
         return _check_empty(
-            BytesIO(file.read().encode("utf8")),
+            BytesIO(data),
             context="StringIO",
             read_position=file.tell(),
             raise_if_empty=raise_if_empty,
+            size=len(data),
         )
 
     if isinstance(file, BytesIO):
         if not has_utf8_utf8_lossy_encoding:
             return _check_empty(
-                BytesIO(file.read().decode(encoding_str).encode("utf8")),
+                _transcode_to_utf8_bytesio(file, encoding_str),
                 context="BytesIO",
                 read_position=file.tell(),
                 raise_if_empty=raise_if_empty,
             )
-        return managed_file(
+        return nullcontext(
             _check_empty(
                 b=file,
                 context="BytesIO",
@@ -188,12 +194,13 @@ def prepare_file_arg(
 
     if isinstance(file, Path):
         if not has_utf8_utf8_lossy_encoding:
-            return _check_empty(
-                BytesIO(file.read_bytes().decode(encoding_str).encode("utf8")),
-                context=f"Path ({file!r})",
-                raise_if_empty=raise_if_empty,
-            )
-        return managed_file(normalize_filepath(file, check_not_directory=check_not_dir))
+            with file.open("rb") as f:
+                return _check_empty(
+                    _transcode_to_utf8_bytesio(f, encoding_str),
+                    context=f"Path ({file!r})",
+                    raise_if_empty=raise_if_empty,
+                )
+        return nullcontext(normalize_filepath(file, check_not_directory=check_not_dir))
 
     if isinstance(file, str):
         # make sure that this is before fsspec
@@ -201,33 +208,36 @@ def prepare_file_arg(
         # to read from http
         if looks_like_url(file):
             return process_file_url(file, encoding_str)
-        if _FSSPEC_AVAILABLE:
-            from fsspec.utils import infer_storage_options
-
-            # check if it is a local file
-            if infer_storage_options(file)["protocol"] == "file":
-                # (lossy) utf8
-                if has_utf8_utf8_lossy_encoding:
-                    return managed_file(
-                        normalize_filepath(file, check_not_directory=check_not_dir)
-                    )
-                # decode first
-                with Path(file).open(encoding=encoding_str) as f:
-                    return _check_empty(
-                        BytesIO(f.read().encode("utf8")),
-                        context=f"{file!r}",
-                        raise_if_empty=raise_if_empty,
-                    )
+        # plain local paths don't need fsspec to be inspected
+        if (
+            _FSSPEC_AVAILABLE
+            and "://" in file
+            and fsspec.utils.infer_storage_options(file)["protocol"] != "file"
+        ):
             storage_options["encoding"] = encoding
             return fsspec.open(file, **storage_options)
 
+        file = normalize_filepath(file, check_not_directory=check_not_dir)
+        # (lossy) utf8
+        if has_utf8_utf8_lossy_encoding:
+            return nullcontext(file)
+        # decode first (in text mode, so that newlines are normalised)
+        with Path(file).open(encoding=encoding_str) as f:
+            return _check_empty(
+                _transcode_to_utf8_bytesio(f, encoding_str),
+                context=f"{file!r}",
+                raise_if_empty=raise_if_empty,
+            )
+
     if isinstance(file, list) and bool(file) and all(isinstance(f, str) for f in file):
         if _FSSPEC_AVAILABLE:
-            from fsspec.utils import infer_storage_options
-
             if has_utf8_utf8_lossy_encoding:
-                if all(infer_storage_options(f)["protocol"] == "file" for f in file):
-                    return managed_file(
+                infer_storage_options = fsspec.utils.infer_storage_options
+                if all(
+                    "://" not in f or infer_storage_options(f)["protocol"] == "file"
+                    for f in file
+                ):
+                    return nullcontext(
                         [
                             normalize_filepath(f, check_not_directory=check_not_dir)
                             for f in file
@@ -236,23 +246,19 @@ def prepare_file_arg(
             storage_options["encoding"] = encoding
             return fsspec.open_files(file, **storage_options)
 
-    if isinstance(file, str):
-        file = normalize_filepath(file, check_not_directory=check_not_dir)
-        if not has_utf8_utf8_lossy_encoding:
-            with Path(file).open(encoding=encoding_str) as f:
-                return _check_empty(
-                    BytesIO(f.read().encode("utf8")),
-                    context=f"{file!r}",
-                    raise_if_empty=raise_if_empty,
-                )
-
-    return managed_file(file)
+    return nullcontext(file)
 
 
 def _check_empty(
-    b: BytesIO, *, context: str, raise_if_empty: bool, read_position: int | None = None
+    b: BytesIO,
+    *,
+    context: str,
+    raise_if_empty: bool,
+    read_position: int | None = None,
+    size: int | None = None,
 ) -> BytesIO:
-    if raise_if_empty and b.getbuffer().nbytes == 0:
+    # `size` can be passed when the buffer length is already known by the caller
+    if raise_if_empty and (size if size is not None else b.getbuffer().nbytes) == 0:
         hint = (
             f" (buffer position = {read_position}; try seek(0) before reading?)"
             if context in ("StringIO", "BytesIO") and read_position
@@ -268,24 +274,101 @@ def looks_like_url(path: str) -> bool:
 
 
 def process_file_url(path: str, encoding: str | None = None) -> BytesIO:
-    from urllib.request import urlopen
-
-    with urlopen(path) as f:
-        if not encoding or encoding in {"utf8", "utf8-lossy"}:
+    with urllib_request.urlopen(path) as f:
+        # http.client has already parsed Content-Length (`None` if it is missing
+        # or invalid); other responses, such as ftp, may not have a length at all
+        size = getattr(f, "length", None)
+        if encoding and encoding not in _UTF8_ENCODINGS:
+            buf = _transcode_to_utf8_bytesio(f, encoding, size_hint=size)
+            # reading in chunks stops silently on a short body, so check that
+            # everything advertised by Content-Length was actually received
+            if remaining := getattr(f, "length", None):
+                from http.client import IncompleteRead
+
+                raise IncompleteRead(buf.getvalue(), remaining)
+            return buf
+        if size is None:
             return BytesIO(f.read())
+
+        # read straight into the final buffer to avoid an intermediate copy
+        buf = _preallocated_bytesio(size)
+        pos = 0
+        with buf.getbuffer() as view:
+            while pos < size:
+                n = f.readinto(view[pos:])
+                if not n:
+                    # http.client signals a short body by returning 0, not raising
+                    from http.client import IncompleteRead
+
+                    raise IncompleteRead(bytes(view[:pos]), size - pos)
+                pos += n
+        return buf
+
+
+def _preallocated_bytesio(size: int) -> BytesIO:
+    buf = BytesIO()
+    if size > 0:
+        # grow the buffer up-front; callers truncate any excess after writing
+        buf.seek(size - 1)
+        buf.write(b"\0")
+        buf.seek(0)
+    return buf
+
+
+def _transcode_to_utf8_bytesio(
+    src: bytes | IO[bytes] | IO[str], encoding: str, *, size_hint: int | None = None
+) -> BytesIO:
+    """
+    Transcode `src` from `encoding` to utf8, chunk by chunk.
+
+    Only a single chunk of decoded text is alive at any time, so peak memory
+    stays close to the size of the output buffer. Text streams are expected to
+    have been opened with `encoding` already, and only need re-encoding.
+    """
+    # fail early on codecs that are not text encodings (eg: "hex"), mirroring
+    # the error raised by `bytes.decode` (which skips this check for empty input)
+    if not getattr(codecs.lookup(encoding), "_is_text_encoding", True):
+        msg = f"{encoding!r} is not a text encoding"
+        raise LookupError(msg)
+
+    if isinstance(src, bytes) and size_hint is None:
+        size_hint = len(src)
+    buf = _preallocated_bytesio(size_hint or 0)
+
+    if isinstance(src, TextIOBase):
+        for text in iter(lambda: src.read(_CHUNK_SIZE), ""):
+            buf.write(text.encode("utf8"))
+    else:
+        if isinstance(src, bytes):
+            view = memoryview(src)
+            chunks: Iterator[bytes | memoryview] = (
+                view[i : i + _CHUNK_SIZE] for i in range(0, len(view), _CHUNK_SIZE)
+            )
         else:
-            return BytesIO(f.read().decode(encoding).encode("utf8"))
+            stream = cast(IO[bytes], src)
+            chunks = iter(lambda: stream.read(_CHUNK_SIZE), b"")
+
+        decoder = codecs.getincrementaldecoder(encoding)()
+        for chunk in chunks:
+            buf.write(decoder.decode(chunk).encode("utf8"))
+        buf.write(decoder.decode(b"", final=True).encode("utf8"))
+
+    buf.truncate()
+    buf.seek(0)
+    return buf
 
 
 def is_glob_pattern(file: str) -> bool:
-    return any(char in file for char in ["*", "?", "["])
+    return not _GLOB_CHARS.isdisjoint(file)
 
 
 def is_supported_cloud(file: str) -> bool:
-    return bool(re.match("^(s3a?|gs|gcs|file|abfss?|azure|az|adl|https?)://", file))
+    return _CLOUD_RE.match(file) is not None
 
 
 def is_local_file(file: str) -> bool:
+    if not is_glob_pattern(file):
+        return os.path.lexists(file)
     try:
         next(glob.iglob(file, recursive=True))  # noqa: PTH207
     except StopIteration:
@@ -1,10 +1,23 @@
 from __future__ import annotations
 
-from typing import Sequence
+import http.client
+from io import BytesIO
+from typing import TYPE_CHECKING, Sequence
 
 import pytest
 
-from polars.io._utils import looks_like_url, parse_columns_arg, parse_row_index_args
+import polars.io._utils as io_utils
+from polars.io._utils import (
+    _transcode_to_utf8_bytesio,
+    looks_like_url,
+    parse_columns_arg,
+    parse_row_index_args,
+    prepare_file_arg,
+    process_file_url,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
 
 
 @pytest.mark.parametrize(
@@ -57,3 +70,147 @@ def test_parse_row_index_args() -> None:
 )
 def test_looks_like_url(url: str, result: bool) -> None:
     assert looks_like_url(url) == result
+
+
+@pytest.mark.parametrize("encoding", ["big5", "cp932", "utf-16"])
+def test_transcode_to_utf8_bytesio_across_chunks(
+    encoding: str, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    # use a tiny chunk size so that multibyte sequences get split between chunks
+    monkeypatch.setattr(io_utils, "_CHUNK_SIZE", 3)
+
+    text = "a,b\n中文,日本"
+    data = text.encode(encoding)
+    expected = text.encode("utf8")
+
+    assert _transcode_to_utf8_bytesio(data, encoding).getvalue() == expected
+
+    src = BytesIO(b"skip" + data)
+    src.seek(4)
+    assert _transcode_to_utf8_bytesio(src, encoding).getvalue() == expected
+
+    path = tmp_path / "data.csv"
+    path.write_bytes(data)
+    with path.open("rb") as f:
+        assert _transcode_to_utf8_bytesio(f, encoding).getvalue() == expected
+    with path.open(encoding=encoding) as f:
+        assert _transcode_to_utf8_bytesio(f, encoding).getvalue() == expected
+
+    # a truncated trailing sequence must not be silently dropped
+    with pytest.raises(UnicodeDecodeError):
+        _transcode_to_utf8_bytesio(data[:-1], encoding)
+    with pytest.raises(UnicodeDecodeError):
+        _transcode_to_utf8_bytesio(BytesIO(data[:-1]), encoding)
+
+
+@pytest.mark.parametrize("encoding", ["hex", "rot13"])
+def test_transcode_to_utf8_bytesio_not_text_encoding(encoding: str) -> None:
+    with pytest.raises(LookupError, match="not a text encoding"):
+        _transcode_to_utf8_bytesio(b"a,b\n1,2\n", encoding)
+    with pytest.raises(LookupError, match="not a text encoding"):
+        prepare_file_arg(b"a,b\n1,2\n", encoding=encoding)
+
+
+def test_prepare_file_arg_transcode_newlines(tmp_path: Path) -> None:
+    path = tmp_path / "data.csv"
+    path.write_bytes("a,b\r\n1,é\r2,3\n".encode("cp1252"))
+
+    # string paths are read in text mode, normalising all newlines...
+    with prepare_file_arg(str(path), encoding="cp1252") as data:
+        assert isinstance(data, BytesIO)
+        assert data.getvalue() == "a,b\n1,é\n2,3\n".encode()
+
+    # ...whereas `Path` objects are transcoded as-is
+    with prepare_file_arg(path, encoding="cp1252") as data:
+        assert isinstance(data, BytesIO)
+        assert data.getvalue() == "a,b\r\n1,é\r2,3\n".encode()
+
+
+class _FakeSocket:
+    def __init__(self, raw: bytes) -> None:
+        self._raw = raw
+
+    def makefile(self, mode: str) -> BytesIO:
+        return BytesIO(self._raw)
+
+
+def _http_response(body: bytes, headers: bytes) -> http.client.HTTPResponse:
+    raw = b"HTTP/1.0 200 OK\r\n" + headers + b"\r\n" + body
+    response = http.client.HTTPResponse(_FakeSocket(raw))  # type: ignore[arg-type]
+    response.begin()
+    return response
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [
+        b"Content-Length: 8\r\n",
+        b"",
+        b"Content-Length: abc\r\n",
+    ],
+)
+def test_process_file_url(headers: bytes, monkeypatch: pytest.MonkeyPatch) -> None:
+    response = _http_response(b"a,b\n1,2\n", headers)
+    monkeypatch.setattr(io_utils.urllib_request, "urlopen", lambda path: response)
+
+    buf = process_file_url("https://pola.rs/data.csv")
+    assert buf.tell() == 0
+    assert buf.getvalue() == b"a,b\n1,2\n"
+
+
+def test_process_file_url_short_body(monkeypatch: pytest.MonkeyPatch) -> None:
+    # a body shorter than the advertised length is an error, not a short result
+    response = _http_response(b"a,b\n1,2\n", b"Content-Length: 1000\r\n")
+    monkeypatch.setattr(io_utils.urllib_request, "urlopen", lambda path: response)
+
+    with pytest.raises(http.client.IncompleteRead):
+        process_file_url("https://pola.rs/data.csv")
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [
+        b"Content-Length: 13\r\n",
+        b"",
+        b"Content-Length: abc\r\n",
+    ],
+)
+def test_process_file_url_transcode(
+    headers: bytes, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(io_utils, "_CHUNK_SIZE", 3)
+    response = _http_response("a,b\n中文,日本".encode("cp932"), headers)
+    monkeypatch.setattr(io_utils.urllib_request, "urlopen", lambda path: response)
+
+    buf = process_file_url("https://pola.rs/data.csv", encoding="cp932")
+    assert buf.getvalue() == "a,b\n中文,日本".encode()
+
+
+def test_process_file_url_transcode_short_body(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    body = "a,b\n1,é\n".encode("cp1252")
+    response = _http_response(body, b"Content-Length: 1000\r\n")
+    monkeypatch.setattr(io_utils.urllib_request, "urlopen", lambda path: response)
+
+    with pytest.raises(http.client.IncompleteRead):
+        process_file_url("https://pola.rs/data.csv", encoding="cp1252")
+
+
+@pytest.mark.parametrize("fsspec_available", [True, False])
+def test_prepare_file_arg_local_str(
+    fsspec_available: bool, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setattr(io_utils, "_FSSPEC_AVAILABLE", fsspec_available)
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("USERPROFILE", str(tmp_path))
+    path = tmp_path / "x.csv"
+    path.write_bytes("a,b\n1,é\n".encode("cp1252"))
+
+    # local paths are normalised, with or without fsspec
+    with prepare_file_arg("~/x.csv") as data:
+        assert data == str(path)
+
+    with prepare_file_arg("~/x.csv", encoding="cp1252") as data:
+        assert isinstance(data, BytesIO)
+        assert data.getvalue() == "a,b\n1,é\n".encode()
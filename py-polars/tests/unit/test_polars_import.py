@@ -84,8 +84,11 @@ def test_polars_import() -> None:
         tbl_hide_dataframe_shape=True,
     ):
         # ensure that we have not broken lazy-loading (numpy, pandas, pyarrow, etc).
+        # (map aliases such as `urllib_request` to the underlying module name)
         lazy_modules = [
-            dep for dep in pl.dependencies.__all__ if not dep.startswith("_")
+            getattr(pl.dependencies, dep).__name__
+            for dep in pl.dependencies.__all__
+            if not dep.startswith("_")
         ]
         for mod in lazy_modules:
             not_imported = not df_import["import"].str.starts_with(mod).any()
@@ -97,3 +100,17 @@ def test_polars_import() -> None:
             import_time_ms = polars_import_time // 1_000
             msg = f"Possible import speed regression; took {import_time_ms}ms\n{df_import}"
             raise AssertionError(msg)
+
+
+def test_lazy_module_alias(monkeypatch: pytest.MonkeyPatch) -> None:
+    from polars.dependencies import _LazyModule
+
+    # a proxy bound under an alias is replaced by the real module on first use
+    proxy = _LazyModule("urllib.request", module_available=True)
+    monkeypatch.setattr(pl.dependencies, "urllib_request", proxy)
+    assert pl.dependencies.urllib_request is proxy
+    assert callable(proxy.urlopen)
+
+    import urllib.request
+
+    assert pl.dependencies.urllib_request is urllib.request